@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cache
 from json import load as json_load
 from pathlib import Path
 from typing import Any
@@ -14,7 +15,7 @@ class NlpModel(str, Enum):
     NLTK = auto()
 
 
-CONFIG_PATH = Path("conf/config.json")
+CONFIG_PATH = Path(__file__).parent / "config.json"
 
 
 def load_json_from_path(config_path: str | Path) -> Any:
@@ -28,19 +29,34 @@ class Config:
     NLP_MODEL: NlpModel
 
 
+@cache
 def load_default_config() -> Config:
-    """Loads default config from the config path"""
+    """Loads default config from the config path, read once on first use"""
     conf = load_json_from_path(CONFIG_PATH)
     config = Config(conf["SPACY_MODEL"], NlpModel[conf["NLP_MODEL"]])
     return config
 
 
-CONFIG: Config = load_default_config()
+_CUSTOM_CONFIG: Config | None = None
+
+
+def get_config() -> Config:
+    """Returns the custom config if set, otherwise the default config"""
+    if _CUSTOM_CONFIG is not None:
+        return _CUSTOM_CONFIG
+    return load_default_config()
 
 
 def load_config(config: Config | None) -> None:
     """Initializes the config"""
     if config is not None:
-        global CONFIG
+        global _CUSTOM_CONFIG
         logger.info("Custom config selected")
-        CONFIG = config
+        _CUSTOM_CONFIG = config
+
+
+def __getattr__(name: str) -> Any:
+    """Keeps CONFIG importable while deferring the config file read"""
+    if name == "CONFIG":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,73 @@
+"""Startup time benchmark
+
+Imports each module in a fresh interpreter and fails when an import is
+slower than its budget or eagerly pulls in a heavy backend.
+
+Usage:
+    python -m scripts.bench_startup [--repeat N]
+"""
+
+from argparse import ArgumentParser
+from json import loads
+from subprocess import run
+from sys import executable
+from sys import exit as sys_exit
+
+# Seconds, generous enough to absorb machine noise
+IMPORT_BUDGETS: dict[str, float] = {
+    "conf.config": 0.5,
+    "scripts.nlp_cleaning": 0.5,
+    "scripts.tweet": 1.0,
+    "scripts.compare_models": 1.5,
+    "scripts.inference": 1.0,
+}
+
+# Backends that should only be imported once selected
+HEAVY_MODULES = ("sklearn", "xgboost", "nltk", "spacy", "scipy")
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = [name for name in {heavy!r} if name in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def time_import(module: str, repeat: int) -> tuple[float, list[str]]:
+    """Best import time of module over repeat fresh interpreters, and the
+    heavy modules it loaded
+    """
+    best, heavy = float("inf"), []
+    for _ in range(repeat):
+        probe = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+        proc = run([executable, "-c", probe], capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"Failed to import {module}:\n{proc.stderr}")
+        result = loads(proc.stdout.splitlines()[-1])
+        best = min(best, result["elapsed"])
+        heavy = result["heavy"]
+    return best, heavy
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    regressions = []
+    for module, budget in IMPORT_BUDGETS.items():
+        elapsed, heavy = time_import(module, args.repeat)
+        print(f"{module:<28}{elapsed:>8.3f}s  (budget {budget:.1f}s)")
+        if elapsed > budget:
+            regressions.append(f"{module} took {elapsed:.3f}s > {budget:.1f}s")
+        if heavy:
+            regressions.append(f"{module} eagerly imports {', '.join(heavy)}")
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    sys_exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
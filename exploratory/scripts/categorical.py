@@ -0,0 +1,55 @@
+"""Dictionary encoded tweet columns
+
+keyword and location only take a few hundred / thousand distinct values,
+they are carried as pandas categoricals from ingestion to analysis.
+"""
+
+from pathlib import Path
+from typing import Sequence
+
+from pandas import CategoricalDtype, DataFrame, read_csv
+
+CATEGORICAL_COLUMNS = ("keyword", "location")
+
+
+def read_tweets_csv(tweet_path: Path | str) -> DataFrame:
+    """Reads a raw tweet csv with keyword and location as categoricals"""
+    return read_csv(
+        tweet_path, dtype={column: "category" for column in CATEGORICAL_COLUMNS}
+    )
+
+
+def as_categorical(
+    tweet_data: DataFrame,
+    reference: DataFrame | None = None,
+    columns: Sequence[str] = CATEGORICAL_COLUMNS,
+) -> DataFrame:
+    """Casts columns to categoricals, reusing the categories of reference
+    when it has them so codes stay consistent between frames
+    """
+    tweet_data = tweet_data.copy()
+    for column in columns:
+        if column not in tweet_data:
+            continue
+        dtype: CategoricalDtype | str = "category"
+        if reference is not None and isinstance(
+            reference[column].dtype, CategoricalDtype
+        ):
+            dtype = reference[column].dtype
+        tweet_data[column] = tweet_data[column].astype(dtype)
+    return tweet_data
+
+
+def category_codes(
+    tweet_data: DataFrame, columns: Sequence[str] = CATEGORICAL_COLUMNS
+) -> DataFrame:
+    """Integer codes of the columns as compact model features, missing
+    values are coded -1
+    """
+    return DataFrame(
+        {
+            f"{column}_code": tweet_data[column].astype("category").cat.codes
+            for column in columns
+        },
+        index=tweet_data.index,
+    )
@@ -1,25 +1,86 @@
+from ast import literal_eval
 from enum import Enum, auto
 from pathlib import Path
-from pandas import DataFrame, concat, read_csv
-from scipy.sparse import spmatrix
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.svm import SVC
-from xgboost import XGBClassifier
-from sklearn.metrics import (
-    accuracy_score,
-    f1_score,
-    recall_score,
-    precision_score,
-    confusion_matrix,
-)
-
-
-def compare_models_on_df(tweet_data: DataFrame) -> DataFrame:
-    """Selects all the models in MODELS and compares their results on tweet_data."""
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+
+from pandas import DataFrame, concat
+
+from scripts.categorical import CATEGORICAL_COLUMNS, category_codes, read_tweets_csv
+from scripts.corpus import TokenCorpus
+
+if TYPE_CHECKING:
+    from scipy.sparse import spmatrix
+
+
+class Model(str, Enum):
+    """Different used models"""
+
+    LOGISTIC_REGRESSION = auto()
+    DECISION_TREE = auto()
+    RANDOM_FOREST = auto()
+    SUPPORT_VECTOR_MACHINE = auto()
+    XGBOOST = auto()
+
+
+def _logistic_regression() -> Any:
+    from sklearn.linear_model import LogisticRegression
+
+    return LogisticRegression()
+
+
+def _decision_tree() -> Any:
+    from sklearn.tree import DecisionTreeClassifier
+
+    return DecisionTreeClassifier()
+
+
+def _random_forest() -> Any:
+    from sklearn.ensemble import RandomForestClassifier
+
+    return RandomForestClassifier(n_estimators=100)
+
+
+def _support_vector_machine() -> Any:
+    from sklearn.svm import SVC
+
+    return SVC()
+
+
+def _xgboost() -> Any:
+    from xgboost import XGBClassifier
+
+    return XGBClassifier(use_label_encoder=False, eval_metric="logloss")
+
+
+MODELS: dict[Model, Callable[[], Any]] = {
+    Model.LOGISTIC_REGRESSION: _logistic_regression,
+    Model.DECISION_TREE: _decision_tree,
+    Model.RANDOM_FOREST: _random_forest,
+    Model.SUPPORT_VECTOR_MACHINE: _support_vector_machine,
+    Model.XGBOOST: _xgboost,
+}
+
+
+def create_model(model: Model) -> Any:
+    """Imports and instantiates the estimator of model, only when selected"""
+    return MODELS[model]()
+
+
+def compare_models_on_df(
+    tweet_data: DataFrame, models: Iterable[Model] = tuple(Model)
+) -> DataFrame:
+    """Selects the models (all of MODELS by default) and compares their results
+    on tweet_data.
+    """
+    from sklearn.metrics import (
+        accuracy_score,
+        confusion_matrix,
+        f1_score,
+        precision_score,
+        recall_score,
+    )
+    from sklearn.model_selection import train_test_split
+
     VALUES = tweet_data.copy()
     VALUES.drop(columns=["target"], inplace=True)
     PREDICT = tweet_data["target"]
@@ -29,8 +90,9 @@ def compare_models_on_df(tweet_data: DataFrame) -> DataFrame:
         VALUES, PREDICT, test_size=0.3, random_state=42
     )
     results = {}
-    for model_name, model_instance in MODELS.items():
+    for model_name in models:
         try:
+            model_instance = create_model(model_name)
             model_instance.fit(X_train, y_train)
             y_pred = model_instance.predict(X_test)
             accuracy = accuracy_score(y_test, y_pred)
@@ -58,11 +120,25 @@ def compare_models_on_df(tweet_data: DataFrame) -> DataFrame:
 
 def vectorize_txt(tweet_data: DataFrame) -> DataFrame:
     """
-    Vectorizes the text column in the dataframe using TF-IDF and adds the resulting tokens as new columns.
+    Vectorizes the tokenized text column in the dataframe using TF-IDF and adds the resulting tokens as new columns.
+    The tokens produced by cleaning are interned once into a TokenCorpus, no re-tokenization.
+    keyword and location, when present, are replaced by their category codes.
     """
-    vectorizer = TfidfVectorizer()
-    X_txt: spmatrix = vectorizer.fit_transform(tweet_data["cleaned_txt"])
-    tfidf_df = DataFrame(X_txt.toarray(), columns=vectorizer.get_feature_names_out())
+    categorical = [column for column in CATEGORICAL_COLUMNS if column in tweet_data]
+    if categorical:
+        tweet_data = concat(
+            [
+                tweet_data.drop(columns=categorical),
+                category_codes(tweet_data, categorical),
+            ],
+            axis=1,
+        )
+    corpus = TokenCorpus.from_tokens(
+        literal_eval(tokens) if isinstance(tokens, str) else tokens
+        for tokens in tweet_data["tokenized_text"]
+    )
+    X_txt: "spmatrix" = corpus.tfidf()
+    tfidf_df = DataFrame(X_txt.toarray(), columns=corpus.vocabulary.words)
     tweet_data = concat(
         [tweet_data.reset_index(drop=True), tfidf_df.reset_index(drop=True)], axis=1
     )
@@ -70,28 +146,10 @@ def vectorize_txt(tweet_data: DataFrame) -> DataFrame:
     return tweet_data
 
 
-class Model(str, Enum):
-    """Different used models"""
-
-    LOGISTIC_REGRESSION = auto()
-    DECISION_TREE = auto()
-    RANDOM_FOREST = auto()
-    SUPPORT_VECTOR_MACHINE = auto()
-    XGBOOST = auto()
-
-
-MODELS = {
-    Model.LOGISTIC_REGRESSION: LogisticRegression(),
-    Model.DECISION_TREE: DecisionTreeClassifier(),
-    Model.RANDOM_FOREST: RandomForestClassifier(n_estimators=100),
-    Model.SUPPORT_VECTOR_MACHINE: SVC(),
-    Model.XGBOOST: XGBClassifier(use_label_encoder=False, eval_metric="logloss"),
-}
-
-
-def compare_models_on_csv(tweet_path: Path | str) -> DataFrame:
-    tweet_data = read_csv(tweet_path)
+def compare_models_on_csv(
+    tweet_path: Path | str, models: Iterable[Model] = tuple(Model)
+) -> DataFrame:
+    tweet_data = read_tweets_csv(tweet_path)
     vectorized_data = vectorize_txt(tweet_data)
-    compare = compare_models_on_df(vectorized_data)
+    compare = compare_models_on_df(vectorized_data, models)
     return compare
-
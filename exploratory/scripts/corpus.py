@@ -0,0 +1,157 @@
+"""Integer token id corpus
+
+Cleaned tweets are interned once into a Vocabulary and stored as a ragged
+array: a flat token id buffer plus per tweet offsets. Word counts, top k
+frequencies and TF-IDF are computed from it with NumPy, without joining and
+re-splitting strings.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Iterable, Sequence
+
+from numpy import (
+    arange,
+    argsort,
+    bincount,
+    diff,
+    fromiter,
+    int32,
+    int64,
+    log,
+    ndarray,
+    ones,
+    repeat,
+    sqrt,
+    unique,
+)
+
+if TYPE_CHECKING:
+    from scipy.sparse import csr_matrix
+
+
+@dataclass
+class Vocabulary:
+    """Interned words, ids are given in order of first appearance"""
+
+    words: list[str] = field(default_factory=list)
+    ids: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def intern(self, word: str) -> int:
+        """Returns the id of word, adding it to the vocabulary if new"""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            word_id = len(self.words)
+            self.ids[word] = word_id
+            self.words.append(word)
+        return word_id
+
+
+@dataclass
+class TokenCorpus:
+    """Ragged array of token ids, tweet i is token_ids[offsets[i]:offsets[i + 1]]"""
+
+    vocabulary: Vocabulary
+    token_ids: ndarray
+    offsets: ndarray
+
+    @classmethod
+    def from_tokens(
+        cls, tokenized: Iterable[Sequence[str]], vocabulary: Vocabulary | None = None
+    ) -> "TokenCorpus":
+        """Interns already tokenized tweets"""
+        vocab = Vocabulary() if vocabulary is None else vocabulary
+        ids: list[int] = []
+        offsets = [0]
+        for tokens in tokenized:
+            ids.extend(vocab.intern(token) for token in tokens)
+            offsets.append(len(ids))
+        return cls(
+            vocab,
+            fromiter(ids, dtype=int32, count=len(ids)),
+            fromiter(offsets, dtype=int64, count=len(offsets)),
+        )
+
+    @classmethod
+    def from_txts(cls, txts: Iterable[str]) -> "TokenCorpus":
+        """Cleans raw tweet texts and interns their tokens"""
+        from scripts.tweet import tokenize_txt
+
+        return cls.from_tokens(tokenize_txt(txt) for txt in txts)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def tokens(self, index: int) -> list[str]:
+        """Words of the tweet at index"""
+        ids = self.token_ids[self.offsets[index] : self.offsets[index + 1]]
+        return [self.vocabulary.words[word_id] for word_id in ids]
+
+    @property
+    def doc_lengths(self) -> ndarray:
+        """Nb of tokens of each tweet"""
+        return diff(self.offsets)
+
+    @property
+    def doc_ids(self) -> ndarray:
+        """Tweet index of each token of token_ids"""
+        return repeat(arange(len(self)), self.doc_lengths)
+
+    def word_counts(self) -> ndarray:
+        """Total occurences of each word id"""
+        return bincount(self.token_ids, minlength=len(self.vocabulary))
+
+    def doc_freqs(self) -> ndarray:
+        """Nb of tweets containing each word id"""
+        pairs = unique(self.doc_ids * len(self.vocabulary) + self.token_ids)
+        return bincount(pairs % len(self.vocabulary), minlength=len(self.vocabulary))
+
+    def most_common(self, k: int, exclude: Iterable[str] = ()) -> list[tuple[str, int]]:
+        """Top k words and their counts, ties ordered by first appearance like
+        Counter.most_common
+        """
+        counts = self.word_counts()
+        for word in exclude:
+            word_id = self.vocabulary.ids.get(word)
+            if word_id is not None:
+                counts[word_id] = 0
+        k = min(k, int((counts > 0).sum()))
+        top = argsort(-counts, kind="stable")[:k]
+        return [
+            (self.vocabulary.words[word_id], int(counts[word_id])) for word_id in top
+        ]
+
+    def tfidf(
+        self, smooth_idf: bool = True, sublinear_tf: bool = False
+    ) -> "csr_matrix":
+        """TF-IDF matrix of shape (tweets, vocabulary), l2 normalized rows.
+        Same weighting as sklearn's TfidfVectorizer defaults, columns follow
+        vocabulary ids.
+        """
+        from scipy.sparse import csr_matrix
+
+        shape = (len(self), len(self.vocabulary))
+        counts = csr_matrix(
+            (ones(len(self.token_ids)), (self.doc_ids, self.token_ids)),
+            shape=shape,
+        )
+        counts.sum_duplicates()
+        tf = counts.data
+        if sublinear_tf:
+            tf = log(tf) + 1
+        smooth = int(smooth_idf)
+        idf = log((len(self) + smooth) / (self.doc_freqs() + smooth)) + 1
+        weights = tf * idf[counts.indices]
+        row_lengths = diff(counts.indptr)
+        row_norms = sqrt(
+            bincount(
+                repeat(arange(len(self)), row_lengths),
+                weights=weights**2,
+                minlength=len(self),
+            )
+        )
+        row_norms[row_norms == 0] = 1
+        weights /= repeat(row_norms, row_lengths)
+        return csr_matrix((weights, counts.indices, counts.indptr), shape=shape)
@@ -0,0 +1,309 @@
+"""Micro-batching local inference service for tweet classification
+
+Loads a persisted vectorizer and model once, then serves predictions over
+JSON lines on stdin or a local HTTP endpoint. Incoming tweets are grouped
+into micro-batches bounded by size and latency before being cleaned,
+vectorized and predicted together.
+
+Usage:
+    python -m scripts.inference MODEL_PATH [--http PORT]
+"""
+
+from argparse import ArgumentParser
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from pathlib import Path
+from pickle import dump as pickle_dump
+from pickle import load as pickle_load
+from queue import Empty, Queue
+from sys import stdin, stdout
+from threading import Thread
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Sequence, TextIO
+
+from loguru import logger
+
+from scripts.tweet import clean_txts
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+DEFAULT_MAX_BATCH_SIZE = 64
+DEFAULT_MAX_LATENCY_MS = 10.0
+DEFAULT_TIMEOUT_S = 30.0
+
+
+@dataclass
+class InferencePipeline:
+    """Fitted vectorizer and model, persisted together"""
+
+    vectorizer: "TfidfVectorizer"
+    model: Any
+
+    def predict_cleaned(self, cleaned_txts: Sequence[str]) -> list[int]:
+        """Predicts targets of already cleaned texts in a single vectorized call"""
+        features = self.vectorizer.transform(cleaned_txts)
+        return [int(pred) for pred in self.model.predict(features)]
+
+    def predict(self, txts: Sequence[str]) -> list[int]:
+        """Cleans then predicts the targets of raw tweet texts"""
+        return self.predict_cleaned(clean_txts(txts))
+
+    def save(self, path: Path | str) -> None:
+        """Persists the pipeline to path"""
+        with open(path, "wb") as pipeline_file:
+            pickle_dump(self, pipeline_file)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "InferencePipeline":
+        """Loads a persisted pipeline from path"""
+        with open(path, "rb") as pipeline_file:
+            pipeline = pickle_load(pipeline_file)
+        if not isinstance(pipeline, cls):
+            raise TypeError(f"{path} does not contain an InferencePipeline")
+        return pipeline
+
+
+def fit_pipeline(tweet_data: "DataFrame", model: Any) -> InferencePipeline:
+    """Fits a vectorizer and model on the cleaned_txt and target columns"""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    vectorizer = TfidfVectorizer()
+    features = vectorizer.fit_transform(tweet_data["cleaned_txt"].fillna(""))
+    model.fit(features, tweet_data["target"].astype(int))
+    return InferencePipeline(vectorizer, model)
+
+
+@dataclass
+class _Request:
+    txt: str
+    future: Future[int] = field(default_factory=Future)
+
+
+class MicroBatcher:
+    """Groups submitted tweets into batches of at most max_batch_size,
+    waiting no longer than max_latency_ms after the first tweet of a batch.
+    """
+
+    def __init__(
+        self,
+        pipeline: InferencePipeline,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_latency_ms: float = DEFAULT_MAX_LATENCY_MS,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000
+        self._queue: Queue[_Request | None] = Queue()
+        self._worker = Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, txt: str) -> Future[int]:
+        """Queues a tweet text, the future resolves to its predicted target"""
+        request = _Request(txt)
+        self._queue.put(request)
+        return request.future
+
+    def close(self) -> None:
+        """Flushes pending requests and stops the worker"""
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self, first: _Request) -> tuple[list[_Request], bool]:
+        """Collects a batch starting with first, returns it and whether to stop"""
+        batch = [first]
+        deadline = monotonic() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - monotonic()
+            if timeout <= 0:
+                break
+            try:
+                request = self._queue.get(timeout=timeout)
+            except Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _process(self, batch: list[_Request]) -> None:
+        """Runs the pipeline on a batch and resolves its futures. Failures,
+        including the SystemExit raised by nlp_clean, fail the batch's futures
+        instead of the worker.
+        """
+        try:
+            preds = self.pipeline.predict([request.txt for request in batch])
+        except BaseException as e:
+            logger.warning(f"Failed to predict batch of {len(batch)} due to:\n{e!r}")
+            error = e if isinstance(e, Exception) else RuntimeError(repr(e))
+            for request in batch:
+                request.future.set_exception(error)
+            return
+        for request, pred in zip(batch, preds):
+            request.future.set_result(pred)
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stop = self._collect(first)
+            self._process(batch)
+
+
+def _submit_line(batcher: MicroBatcher, line: str) -> tuple[Any, Future[int]]:
+    """Parses a {"id": ..., "text": ...} line and submits its text, a
+    malformed line gets an already failed future
+    """
+    tweet_id = None
+    try:
+        tweet = loads(line)
+        tweet_id = tweet.get("id")
+        txt = tweet["text"]
+        if not isinstance(txt, str):
+            raise TypeError(f"text must be a string, got {type(txt).__name__}")
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        failed: Future[int] = Future()
+        failed.set_exception(ValueError(f"Malformed line: {e!r}"))
+        return tweet_id, failed
+    return tweet_id, batcher.submit(txt)
+
+
+def serve_json_lines(
+    batcher: MicroBatcher,
+    src: TextIO = stdin,
+    dst: TextIO = stdout,
+    timeout: float = DEFAULT_TIMEOUT_S,
+) -> None:
+    """Reads {"id": ..., "text": ...} lines from src and writes
+    {"id": ..., "target": ...} lines to dst, in input order. Lines that fail
+    are written as {"id": ..., "error": ...} and the stream goes on.
+    """
+    pending: Queue[tuple[Any, Future[int]] | None] = Queue()
+
+    def write_results() -> None:
+        while (item := pending.get()) is not None:
+            tweet_id, future = item
+            try:
+                record = {"id": tweet_id, "target": future.result(timeout)}
+            except Exception as e:
+                record = {"id": tweet_id, "error": str(e) or repr(e)}
+            dst.write(dumps(record) + "\n")
+            dst.flush()
+
+    writer = Thread(target=write_results, daemon=True)
+    writer.start()
+    for line in src:
+        if line.strip():
+            pending.put(_submit_line(batcher, line))
+    pending.put(None)
+    writer.join()
+
+
+def _body_txts(body: Any) -> list[str]:
+    """Texts of a {"text": ...} or {"texts": [...]} request body, rejected
+    before submission unless they all are strings
+    """
+    if not isinstance(body, dict):
+        raise TypeError(f"body must be a JSON object, got {type(body).__name__}")
+    txts = body["texts"] if "texts" in body else [body["text"]]
+    if not isinstance(txts, list) or not all(isinstance(txt, str) for txt in txts):
+        raise TypeError("text must be a string and texts a list of strings")
+    return txts
+
+
+def _make_handler(
+    batcher: MicroBatcher, timeout: float = DEFAULT_TIMEOUT_S
+) -> type[BaseHTTPRequestHandler]:
+    class PredictHandler(BaseHTTPRequestHandler):
+        """POST /predict with {"text": ...} or {"texts": [...]}"""
+
+        def do_POST(self) -> None:
+            if self.path != "/predict":
+                self.send_error(404)
+                return
+            try:
+                body = loads(self.rfile.read(int(self.headers["Content-Length"])))
+                txts = _body_txts(body)
+            except (KeyError, TypeError, ValueError) as e:
+                self.send_error(400, str(e))
+                return
+            futures = [batcher.submit(txt) for txt in txts]
+            deadline = monotonic() + timeout
+            try:
+                targets = [
+                    future.result(max(0, deadline - monotonic())) for future in futures
+                ]
+            except FuturesTimeoutError:
+                self.send_error(504, "Prediction timed out")
+                return
+            except Exception as e:
+                self.send_error(500, str(e) or repr(e))
+                return
+            payload = (
+                {"targets": targets} if "texts" in body else {"target": targets[0]}
+            )
+            response = dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(response)))
+            self.end_headers()
+            self.wfile.write(response)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            logger.debug(format % args)
+
+    return PredictHandler
+
+
+def serve_http(
+    batcher: MicroBatcher,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    timeout: float = DEFAULT_TIMEOUT_S,
+) -> None:
+    """Serves predictions on http://host:port/predict until interrupted"""
+    server = ThreadingHTTPServer((host, port), _make_handler(batcher, timeout))
+    logger.info(f"Serving predictions on http://{host}:{port}/predict")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("model_path", type=Path)
+    parser.add_argument("--http", type=int, metavar="PORT", default=None)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-latency-ms", type=float, default=DEFAULT_MAX_LATENCY_MS)
+    parser.add_argument("--timeout-s", type=float, default=DEFAULT_TIMEOUT_S)
+    args = parser.parse_args()
+
+    pipeline = InferencePipeline.load(args.model_path)
+    batcher = MicroBatcher(pipeline, args.max_batch_size, args.max_latency_ms)
+    try:
+        if args.http is None:
+            serve_json_lines(batcher, timeout=args.timeout_s)
+        else:
+            serve_http(batcher, args.host, args.http, args.timeout_s)
+    finally:
+        batcher.close()
+
+
+if __name__ == "__main__":
+    # Run from the imported module so InferencePipeline is
+    # scripts.inference.InferencePipeline, the class pickled by save
+    from scripts.inference import main as module_main
+
+    module_main()
@@ -8,15 +8,36 @@ from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import word_tokenize
 
 
+@cache
+def download_nltk_data() -> None:
+    """Downloads the nltk resources once per process"""
+    nltk_dl("stopwords", quiet=True)
+    nltk_dl("punkt", quiet=True)
+    nltk_dl("punkt_tab", quiet=True)
+    nltk_dl("wordnet", quiet=True)
+
+
+@cache
+def load_stop_words() -> frozenset[str]:
+    """Loads the english stop words once"""
+    return frozenset(stopwords.words("english"))
+
+
+@cache
+def load_lemmatizer() -> WordNetLemmatizer:
+    """Loads the lemmatizer once"""
+    return WordNetLemmatizer()
+
+
 def rm_stop_words(txt: list[str]) -> list[str]:
     """Removes stop words from txt using ntlk"""
-    stop_words = set(stopwords.words("english"))
+    stop_words = load_stop_words()
     return [word for word in txt if word not in stop_words]
 
 
 def lemmatize(txt: list[str]) -> list[str]:
     """Uses Nltk to remove stop words"""
-    lemmatizer = WordNetLemmatizer()
+    lemmatizer = load_lemmatizer()
     return [lemmatizer.lemmatize(word.strip()) for word in txt]
 
 
@@ -27,9 +48,7 @@ def nltk_clean(txt: str) -> list[str]:
     - Stop words removal
     - Lemmatization
     """
-    nltk_dl("stopwords")
-    nltk_dl("punkt")
-    nltk_dl("wordnet")
+    download_nltk_data()
 
     tokenized = word_tokenize(txt)
     wo_stop_words = rm_stop_words(tokenized)
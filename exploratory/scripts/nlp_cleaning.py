@@ -1,27 +1,43 @@
 """NLP Cleaning Models"""
 
+from functools import cache
 from sys import exit as sys_exit
 from typing import Callable, TypeAlias
 
 from conf.config import NlpModel
 from loguru import logger
 
-from scripts.models.nltk_clean import nltk_clean
+CleaningFunc: TypeAlias = Callable[[str], list[str]]
 
-# from scripts.models.spacy_clean import spacy_clean
 
-CleaningFunc: TypeAlias = Callable[[str], list[str]]
+def _load_nltk_clean() -> CleaningFunc:
+    from scripts.models.nltk_clean import nltk_clean
+
+    return nltk_clean
+
 
-CLEANING_MAP: dict[NlpModel, CleaningFunc] = {
-    NlpModel.NLTK: nltk_clean,
-    # NlpModel.SPACY: spacy_clean,
+# def _load_spacy_clean() -> CleaningFunc:
+#     from scripts.models.spacy_clean import spacy_clean
+#
+#     return spacy_clean
+
+
+CLEANING_MAP: dict[NlpModel, Callable[[], CleaningFunc]] = {
+    NlpModel.NLTK: _load_nltk_clean,
+    # NlpModel.SPACY: _load_spacy_clean,
 }
 
 
+@cache
+def get_cleaning_func(model: NlpModel) -> CleaningFunc:
+    """Imports the NLP backend of model on first use. See CLEANING_MAP"""
+    return CLEANING_MAP[model]()
+
+
 def nlp_clean(model: NlpModel, txt: str) -> list[str]:
     """Cleans the text using an nlp model. See CLEANING_MAP"""
     try:
-        cleaned = CLEANING_MAP[model](txt)
+        cleaned = get_cleaning_func(model)(txt)
         return cleaned
     except KeyError as key_err:
         logger.critical(f"NLP Model cleaning not implimented:\n{key_err}")
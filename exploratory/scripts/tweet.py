@@ -3,15 +3,17 @@
 from functools import cached_property
 from re import findall, sub
 from string import punctuation
-from typing import Any
+from typing import TYPE_CHECKING, Any, Sequence
 from unicodedata import normalize
 
-from conf.config import CONFIG
+from conf.config import get_config
 from contractions import fix  # type: ignore
-from pandera.typing import Series
 from pydantic import BaseModel
 from scripts.nlp_cleaning import nlp_clean
 
+if TYPE_CHECKING:
+    from pandera.typing import Series
+
 _HASHTAG_PATTERN = r"#\S+"
 _USERNAME_PATTERN = r"@\S+"
 _EMAIL_PATTERN = r"\S*@\S*\s?"
@@ -50,6 +52,29 @@ def expand_contractions(txt: str) -> str:
     return str(fix(txt))
 
 
+def tokenize_txt(txt: str) -> list[str]:
+    """Cleans the text using the listed specs:
+    - Lowercases and strips the entire string
+    - Punctuation removal
+    - Number removal
+    - Whitespaces removal
+    - Expanded context (contractions)
+    - Text Processing (NLP)
+    """
+    lower = txt.lower().strip()
+    wo_puncts = rm_punctuations(lower)
+    wo_numbers = rm_numbers(wo_puncts)
+    wo_whitespaces = rm_whitespaces(wo_numbers)
+    wo_unicodes = rm_unicodes(wo_whitespaces)
+    expanded = expand_contractions(wo_unicodes)
+    return nlp_clean(get_config().NLP_MODEL, expanded)
+
+
+def clean_txts(txts: Sequence[str]) -> list[str]:
+    """Cleans a batch of texts, returns space joined tokens ready to vectorize"""
+    return [" ".join(tokenize_txt(txt)) for txt in txts]
+
+
 class Tweet(BaseModel):
     """Namespace for handling tweets"""
 
@@ -61,22 +86,8 @@ class Tweet(BaseModel):
 
     @property
     def tokenized_text(self) -> list[str]:
-        """Cleans the text using the listed specs:
-        - Lowercases and strips the entire string
-        - Punctuation removal
-        - Number removal
-        - Whitespaces removal
-        - Expanded context (contractions)
-        - Text Processing (NLP)
-        """
-        lower = self.txt.lower().strip()
-        wo_puncts = rm_punctuations(lower)
-        wo_numbers = rm_numbers(wo_puncts)
-        wo_whitespaces = rm_whitespaces(wo_numbers)
-        wo_unicodes = rm_unicodes(wo_whitespaces)
-        expanded = expand_contractions(wo_unicodes)
-        nlp_cleaned = nlp_clean(CONFIG.NLP_MODEL, expanded)
-        return nlp_cleaned
+        """Cleans the text, see tokenize_txt"""
+        return tokenize_txt(self.txt)
 
     @property
     def cleaned_txt(self) -> str:
@@ -134,13 +145,18 @@ class Tweet(BaseModel):
         return self.emails != []
 
 
-def create_tweet(row: Series[Any]) -> Tweet:
+def _str_or_none(value: Any) -> str | None:
+    """Missing values of categorical columns stay NaN, map them to None"""
+    return value if isinstance(value, str) else None
+
+
+def create_tweet(row: "Series[Any]") -> Tweet:
     """Abstraction of tweet creation"""
     target = True if row["target"] == 1 else False
     return Tweet(
         id=row["id"],
-        keyword=row["keyword"],
-        location=row["location"],
+        keyword=_str_or_none(row["keyword"]),
+        location=_str_or_none(row["location"]),
         txt=row["text"],
         target=target,
     )
@@ -1,6 +1,5 @@
 """Tweet Analysis and Graphs"""
 
-from collections import Counter
 from dataclasses import dataclass
 from functools import cached_property
 
@@ -16,6 +15,8 @@ from matplotlib.pyplot import (
 )
 from pandas import DataFrame, notna
 
+from scripts.categorical import as_categorical
+from scripts.corpus import TokenCorpus
 from scripts.ptdf import ptdf
 from scripts.tweet import Tweet, create_tweet
 
@@ -27,6 +28,9 @@ class TweetsAnalysis:
     dataset_name: str
     raw_data: DataFrame
 
+    def __post_init__(self) -> None:
+        self.raw_data = as_categorical(self.raw_data)
+
     @cached_property
     def extra_data(self) -> DataFrame:
         """Returns a df with extra labels"""
@@ -35,18 +39,22 @@ class TweetsAnalysis:
         for _, row in df_none.iterrows():
             tweet = create_tweet(row)  # type: ignore
             obj_tweets.append(tweet)
-        return ptdf(obj_tweets)
+        return as_categorical(ptdf(obj_tweets), reference=self.raw_data)
+
+    @cached_property
+    def raw_corpus(self) -> TokenCorpus:
+        """Whitespace separated words of txt as token ids"""
+        return TokenCorpus.from_tokens(txt.split(" ") for txt in self.extra_data["txt"])
+
+    @cached_property
+    def cleaned_corpus(self) -> TokenCorpus:
+        """Cleaned tokens of each tweet as token ids"""
+        return TokenCorpus.from_tokens(self.extra_data["tokenized_text"])
 
     def plt_word_occs(self, cleaned: bool = False) -> None:
         """Plots the nb of highest occs in a dataframe"""
-        target = "cleaned_txt" if cleaned else "txt"
-        all_text = " ".join([i for i in self.extra_data[target]])
-        words = all_text.split(" ")
-        occs = Counter(words)
-        del occs[" "]
-        del occs["-"]
-        del occs[""]
-        top_100_elements = occs.most_common(100)
+        corpus = self.cleaned_corpus if cleaned else self.raw_corpus
+        top_100_elements = corpus.most_common(100, exclude=(" ", "-", ""))
         elements, counts = zip(*top_100_elements)
         figure(figsize=(20, 10))
         bar(elements, counts)
@@ -61,9 +69,9 @@ class TweetsAnalysis:
         """Plots the count of the specified property categorized by the pivot."""
         colors = ["red", "green"]
         for property in properties:
-            self.extra_data.groupby([property, pivot]).size().unstack().plot(
-                kind="bar", color=colors
-            )
+            self.extra_data.groupby(
+                [property, pivot], observed=True
+            ).size().unstack().plot(kind="bar", color=colors)
             xlabel(property)
             ylabel("Count")
             title(f"Count of {property} by {pivot}")
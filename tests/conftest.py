@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+
+import numpy
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+EXPLORATORY = ROOT / "exploratory"
+TREE_MODELS = ROOT / "tree_models"
+
+for path in (EXPLORATORY, TREE_MODELS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+
+@pytest.fixture
+def make_data():
+    """Factory of noisy (dataframe, integer targets) batches driven by the
+    first feature
+    """
+
+    def make(
+        seed: int = 0,
+        number_rows: int = 200,
+        number_features: int = 4,
+        number_class_labels: int = 2,
+        dtype: type = float,
+    ) -> tuple[numpy.ndarray, numpy.ndarray]:
+        rng = numpy.random.default_rng(seed)
+        dataframe = rng.random((number_rows, number_features)).astype(dtype)
+        noise = rng.random(number_rows) - 0.5
+        targets = ((dataframe[:, 0] + 0.5 * noise) * number_class_labels).astype(int)
+        return dataframe, numpy.clip(targets, 0, number_class_labels - 1)
+
+    return make
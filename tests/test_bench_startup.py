@@ -0,0 +1,11 @@
+import pytest
+from conftest import EXPLORATORY
+
+from scripts.bench_startup import HEAVY_MODULES, IMPORT_BUDGETS, time_import
+
+
+@pytest.mark.parametrize("module", IMPORT_BUDGETS)
+def test_import_loads_no_heavy_backend(monkeypatch, module):
+    monkeypatch.chdir(EXPLORATORY)
+    _, heavy = time_import(module, 1)
+    assert heavy == [], f"{module} eagerly imports {heavy} of {HEAVY_MODULES}"
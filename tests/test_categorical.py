@@ -0,0 +1,78 @@
+import pytest
+from matplotlib.pyplot import close
+from pandas import CategoricalDtype, DataFrame, Series
+
+from scripts.categorical import as_categorical, category_codes, read_tweets_csv
+from scripts.tweet import create_tweet
+from scripts.tweet_analysis import TweetsAnalysis
+
+TWEETS = DataFrame(
+    {
+        "id": [1, 2, 3, 4],
+        "keyword": ["fire", None, "flood", "fire"],
+        "location": ["Paris", "Lyon", None, "Paris"],
+        "text": ["Forest fire", "Nice day", "Flood warning", "Fire again"],
+        "target": [1, 0, 1, 1],
+    }
+)
+
+
+@pytest.fixture(autouse=True)
+def split_cleaning(monkeypatch):
+    """Whitespace cleaning instead of the NLTK data"""
+    monkeypatch.setattr(
+        "scripts.nlp_cleaning.get_cleaning_func", lambda model: str.split
+    )
+
+
+def test_read_tweets_csv_gives_categories(tmp_path):
+    tweet_path = tmp_path / "tweets.csv"
+    TWEETS.to_csv(tweet_path, index=False)
+    tweet_data = read_tweets_csv(tweet_path)
+    assert isinstance(tweet_data["keyword"].dtype, CategoricalDtype)
+    assert isinstance(tweet_data["location"].dtype, CategoricalDtype)
+    assert not isinstance(tweet_data["text"].dtype, CategoricalDtype)
+
+
+def test_as_categorical_reuses_reference_categories():
+    reference = as_categorical(TWEETS)
+    other = as_categorical(TWEETS.iloc[[2, 3]], reference=reference)
+    assert other["keyword"].dtype == reference["keyword"].dtype
+    assert (
+        category_codes(other)["keyword_code"].tolist()
+        == category_codes(reference)["keyword_code"].iloc[[2, 3]].tolist()
+    )
+
+
+def test_category_codes_code_missing_values_as_minus_one():
+    codes = category_codes(as_categorical(TWEETS))
+    assert codes.columns.tolist() == ["keyword_code", "location_code"]
+    assert codes["keyword_code"].iloc[1] == -1
+    assert codes["location_code"].iloc[2] == -1
+    assert (codes.drop(index=[1, 2]) >= 0).all().all()
+
+
+def test_missing_categoricals_become_none():
+    row = as_categorical(TWEETS).iloc[1]
+    assert create_tweet(row).keyword is None
+    extra_data = TweetsAnalysis("train", TWEETS).extra_data
+    assert extra_data["keyword"].isna().tolist() == [False, True, False, False]
+    assert extra_data["location"].isna().tolist() == [False, False, True, False]
+    assert isinstance(extra_data["keyword"].dtype, CategoricalDtype)
+
+
+def test_plt_categorical_property_skips_unobserved_categories(monkeypatch):
+    keyword = Series(TWEETS["keyword"]).astype(
+        CategoricalDtype(["fire", "flood", "unused"])
+    )
+    analysis = TweetsAnalysis("train", TWEETS.assign(keyword=keyword))
+    plotted: list[DataFrame] = []
+    monkeypatch.setattr(
+        DataFrame, "plot", lambda frame, **kwargs: plotted.append(frame)
+    )
+    monkeypatch.setattr("scripts.tweet_analysis.show", lambda: None)
+    try:
+        analysis.plt_categorical_property(["keyword"], "target")
+    finally:
+        close("all")
+    assert plotted[0].index.tolist() == ["fire", "flood"]
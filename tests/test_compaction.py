@@ -0,0 +1,72 @@
+import numpy
+
+from tree_models.compaction import compact_forest, compact_tree
+from tree_models.decision_tree import CustomDecisionTree
+from tree_models.random_forest import CustomRandomForest
+
+
+def near_training_values(dataframe):
+    """Observations within 1e-9 of the training values, around the thresholds"""
+    return numpy.concatenate([dataframe - 1e-9, dataframe, dataframe + 1e-9])
+
+
+def fit_tree(dataframe, targets, seed):
+    numpy.random.seed(seed)
+    tree = CustomDecisionTree(maximum_depth=6)
+    tree.fit(dataframe, targets)
+    return tree
+
+
+def test_compact_tree_predicts_identically_on_float64(make_data):
+    for seed in range(3):
+        dataframe, targets = make_data(seed)
+        tree = fit_tree(dataframe, targets, seed)
+        observations = near_training_values(dataframe)
+        expected = tree.predict(observations)
+
+        compact, report = compact_tree(tree)
+
+        assert report.nodes_after <= report.nodes_before
+        assert compact.thresholds.dtype == numpy.float64
+        numpy.testing.assert_array_equal(compact.predict(observations), expected)
+
+
+def test_compact_tree_stores_float32_thresholds_when_exact(make_data):
+    dataframe, targets = make_data(dtype=numpy.float32)
+    tree = fit_tree(dataframe, targets, 0)
+    observations = near_training_values(dataframe.astype(float))
+    expected = tree.predict(observations)
+
+    compact, _ = compact_tree(tree)
+
+    assert compact.thresholds.dtype == numpy.float32
+    numpy.testing.assert_array_equal(compact.predict(observations), expected)
+
+
+def test_compact_forest_predicts_identically(make_data):
+    dataframe, targets = make_data(1)
+    numpy.random.seed(1)
+    forest = CustomRandomForest(number_trees=7, maximum_depth=4)
+    forest.fit(dataframe, targets)
+    observations = near_training_values(dataframe)
+    expected = forest.predict(observations)
+
+    compact, report = compact_forest(forest)
+
+    assert report.nodes_after < report.nodes_before
+    assert compact.predict(observations) == expected
+
+
+def test_pruning_leaves_the_source_forest_unchanged(make_data):
+    dataframe, targets = make_data(2)
+    numpy.random.seed(2)
+    forest = CustomRandomForest(number_trees=5, maximum_depth=6)
+    forest.fit(dataframe, targets)
+    expected = forest.predict(dataframe)
+
+    _, report = compact_forest(forest, minimum_samples=40)
+    _, unchanged = compact_forest(forest)
+
+    assert report.nodes_after < report.nodes_before
+    assert unchanged.nodes_before == report.nodes_before
+    assert forest.predict(dataframe) == expected
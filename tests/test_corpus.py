@@ -0,0 +1,35 @@
+from collections import Counter
+
+import pytest
+
+from scripts.corpus import TokenCorpus
+
+TWEETS = [
+    ["forest", "fire", "near", "canada"],
+    ["fire", "fire", "evacuation"],
+    [],
+    ["canada", "flood", "near", "fire"],
+]
+
+
+def test_most_common_matches_counter():
+    corpus = TokenCorpus.from_tokens(TWEETS)
+    counter = Counter(token for tokens in TWEETS for token in tokens)
+    assert corpus.most_common(3) == counter.most_common(3)
+    assert corpus.tokens(1) == TWEETS[1]
+
+
+@pytest.mark.parametrize("sublinear_tf", [False, True])
+def test_tfidf_matches_sklearn(sublinear_tf):
+    pytest.importorskip("sklearn")
+    from numpy import abs as np_abs
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    corpus = TokenCorpus.from_tokens(TWEETS)
+    vectorizer = TfidfVectorizer(
+        analyzer=lambda tokens: tokens, sublinear_tf=sublinear_tf
+    )
+    expected = vectorizer.fit_transform(TWEETS)
+    order = [corpus.vocabulary.ids[word] for word in vectorizer.get_feature_names_out()]
+    tfidf = corpus.tfidf(sublinear_tf=sublinear_tf)[:, order]
+    assert np_abs((tfidf - expected).toarray()).max() < 1e-12
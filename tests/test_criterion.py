@@ -0,0 +1,81 @@
+import numpy
+import pytest
+
+from tree_models.criterion import entropy, gini, threshold_gains
+from tree_models.decision_tree import CustomDecisionTree
+
+
+def reference_entropy(target_values):
+    """Per node entropy, as computed before the vectorized kernels"""
+    proportions = numpy.bincount(target_values) / len(target_values)
+    return -sum(p * numpy.log2(p) for p in proportions if p > 0)
+
+
+def reference_gain(feature_values, target_values, threshold):
+    """Per threshold information gain, as computed before the vectorized kernels"""
+    left = target_values[feature_values <= threshold]
+    right = target_values[feature_values > threshold]
+    if len(left) == 0 or len(right) == 0:
+        return 0
+    total = len(target_values)
+    child_loss = len(left) / total * reference_entropy(left) + len(
+        right
+    ) / total * reference_entropy(right)
+    return reference_entropy(target_values) - child_loss
+
+
+class ReferenceTree(CustomDecisionTree):
+    """CustomDecisionTree scoring one threshold at a time"""
+
+    def _best_split(self, dataframe, target_values, features):
+        split = {"score": -1, "feature": None, "threshold": None}
+        for feature in features:
+            for threshold in numpy.unique(dataframe[:, feature]):
+                score = reference_gain(dataframe[:, feature], target_values, threshold)
+                if score > split["score"]:
+                    split = {"score": score, "feature": feature, "threshold": threshold}
+        return split["feature"], split["threshold"], split["score"]
+
+
+@pytest.fixture
+def rounded_data(make_data):
+    """Batches with repeated feature values, so thresholds group several samples"""
+
+    def make(seed: int, number_class_labels: int = 2):
+        dataframe, targets = make_data(
+            seed, 150, 5, number_class_labels=number_class_labels
+        )
+        return numpy.round(dataframe, 2), targets
+
+    return make
+
+
+def test_impurities():
+    counts = numpy.array([[5, 5], [10, 0], [0, 0]])
+    numpy.testing.assert_allclose(entropy(counts), [1, 0, 0])
+    numpy.testing.assert_allclose(gini(counts[:2]), [0.5, 0])
+
+
+@pytest.mark.parametrize("number_class_labels", [2, 3])
+def test_threshold_gains_match_reference(rounded_data, number_class_labels):
+    dataframe, targets = rounded_data(0, number_class_labels)
+    feature_values = dataframe[:, 0]
+    thresholds, gains = threshold_gains(
+        feature_values, targets, entropy, number_class_labels
+    )
+    numpy.testing.assert_array_equal(thresholds, numpy.unique(feature_values))
+    expected = [reference_gain(feature_values, targets, t) for t in thresholds]
+    numpy.testing.assert_allclose(gains, expected, atol=1e-12)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_entropy_tree_predicts_as_before(rounded_data, seed):
+    dataframe, targets = rounded_data(seed)
+    observations = numpy.random.default_rng(seed + 10).random((100, 5))
+    predictions = []
+    for tree_class in (ReferenceTree, CustomDecisionTree):
+        numpy.random.seed(seed)
+        tree = tree_class(maximum_depth=6)
+        tree.fit(dataframe, targets)
+        predictions.append(tree.predict(observations))
+    numpy.testing.assert_array_equal(*predictions)
@@ -0,0 +1,65 @@
+import numpy
+import pytest
+
+from tree_models.compaction import count_nodes
+from tree_models.decision_tree import CustomDecisionTree
+
+
+def fit_tree(dataframe, targets, **options):
+    numpy.random.seed(0)
+    tree = CustomDecisionTree(**options)
+    tree.fit(dataframe, targets)
+    return tree
+
+
+def split_gains(node):
+    """Information gains of the internal nodes of the subtree"""
+    if node.is_leaf():
+        return []
+    return [node.gain, *split_gains(node.left), *split_gains(node.right)]
+
+
+@pytest.mark.parametrize("max_leaf_nodes", [1, 2, 5, 12])
+def test_max_leaf_nodes_gives_exactly_that_many_leaves(make_data, max_leaf_nodes):
+    tree = fit_tree(*make_data(), max_leaf_nodes=max_leaf_nodes)
+    assert count_nodes(tree.root) == (2 * max_leaf_nodes - 1, max_leaf_nodes)
+
+
+@pytest.mark.parametrize("maximum_depth", [2, 4, 100])
+def test_best_first_without_budget_predicts_like_depth_first(make_data, maximum_depth):
+    dataframe, targets = make_data(number_features=1, number_class_labels=3)
+    observations, _ = make_data(seed=1, number_features=1)
+    depth_first = fit_tree(dataframe, targets, maximum_depth=maximum_depth)
+    best_first = fit_tree(
+        dataframe, targets, maximum_depth=maximum_depth, best_first=True
+    )
+
+    assert count_nodes(best_first.root) == count_nodes(depth_first.root)
+    numpy.testing.assert_array_equal(
+        best_first.predict(observations), depth_first.predict(observations)
+    )
+
+
+@pytest.mark.parametrize("best_first", [False, True])
+def test_min_gain_stops_low_gain_splits(make_data, best_first):
+    dataframe, targets = make_data()
+    unbounded = fit_tree(dataframe, targets, best_first=best_first)
+    bounded = fit_tree(dataframe, targets, best_first=best_first, min_gain=0.2)
+    no_split = fit_tree(dataframe, targets, best_first=best_first, min_gain=2)
+
+    assert min(split_gains(unbounded.root)) < 0.2
+    assert min(split_gains(bounded.root)) >= 0.2
+    assert count_nodes(bounded.root)[0] < count_nodes(unbounded.root)[0]
+    assert no_split.root.is_leaf()
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"min_gain": 0.0}, {"best_first": True}],
+    ids=["depth first", "min gain", "best first"],
+)
+def test_conflicting_duplicates_become_a_leaf(options):
+    dataframe = numpy.array([[0, 1], [0, 1], [1, 0], [1, 0]])
+    targets = numpy.array([0, 1, 0, 1])
+    tree = fit_tree(dataframe, targets, **options)
+    assert len(tree.predict(dataframe)) == 4
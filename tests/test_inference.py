@@ -0,0 +1,146 @@
+import sys
+import urllib.error
+import urllib.request
+from io import StringIO
+from json import dumps, loads
+from subprocess import run
+from threading import Thread
+from time import sleep
+
+import pytest
+from conftest import EXPLORATORY
+
+from scripts.inference import MicroBatcher, _make_handler, serve_json_lines
+
+
+class FakePipeline:
+    """Predicts the text length parity, fails on texts containing "bad" """
+
+    def __init__(self, error: BaseException = SystemExit(0), delay: float = 0):
+        self.error = error
+        self.delay = delay
+        self.batches: list[list[str]] = []
+
+    def predict(self, txts: list[str]) -> list[int]:
+        self.batches.append(txts)
+        sleep(self.delay)
+        if any("bad" in txt for txt in txts):
+            raise self.error
+        return [len(txt) % 2 for txt in txts]
+
+
+def test_save_and_load_through_cli(tmp_path):
+    pandas = pytest.importorskip("pandas")
+    pytest.importorskip("sklearn")
+    from sklearn.linear_model import LogisticRegression
+
+    from scripts.inference import fit_pipeline
+
+    tweets = pandas.DataFrame(
+        {"cleaned_txt": ["forest fire", "love cake", "flood warning", "nice day"]},
+    ).assign(target=[1, 0, 1, 0])
+    model_path = tmp_path / "model.pkl"
+    fit_pipeline(tweets, LogisticRegression()).save(model_path)
+
+    lines = [dumps({"id": 1, "text": "Fire in the forest"}), "not json", ""]
+    # python -m scripts.inference, with whitespace cleaning instead of NLTK
+    run_cli = (
+        "import runpy, scripts.nlp_cleaning as nlp_cleaning;"
+        "nlp_cleaning.get_cleaning_func = lambda model: str.split;"
+        "runpy.run_module('scripts.inference', run_name='__main__', alter_sys=True)"
+    )
+    proc = run(
+        [sys.executable, "-c", run_cli, str(model_path)],
+        cwd=EXPLORATORY,
+        input="\n".join(lines),
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert proc.returncode == 0, proc.stderr
+    records = [loads(line) for line in proc.stdout.splitlines()]
+    assert [record["id"] for record in records] == [1, None]
+    assert records[0]["target"] in (0, 1)
+    assert "error" in records[1]
+
+
+def test_worker_survives_system_exit():
+    batcher = MicroBatcher(FakePipeline(), max_batch_size=1, max_latency_ms=1)
+    failed = batcher.submit("bad tweet")
+    assert isinstance(failed.exception(timeout=5), RuntimeError)
+    assert batcher.submit("ok").result(timeout=5) == 0
+    batcher.close()
+
+
+def test_json_lines_writes_errors_and_goes_on():
+    batcher = MicroBatcher(FakePipeline(), max_batch_size=1, max_latency_ms=1)
+    src = StringIO(
+        "\n".join(
+            [
+                dumps({"id": 1, "text": "a"}),
+                dumps({"id": "bad", "text": "bad"}),
+                "{broken",
+                dumps({"id": 4}),
+                dumps({"id": 3, "text": "ab"}),
+            ]
+        )
+    )
+    dst = StringIO()
+    serve_json_lines(batcher, src, dst, timeout=5)
+    batcher.close()
+    records = [loads(line) for line in dst.getvalue().splitlines()]
+    assert [record.get("id") for record in records] == [1, "bad", None, 4, 3]
+    assert records[0]["target"] == 1
+    assert all("error" in record for record in records[1:4])
+    assert records[4]["target"] == 0
+
+
+@pytest.fixture
+def serve(request):
+    """Serves a batcher over HTTP, returns a function posting a body to it"""
+    from http.server import ThreadingHTTPServer
+
+    def start(batcher, timeout=5):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(batcher, timeout))
+        Thread(target=server.serve_forever, daemon=True).start()
+
+        def stop():
+            server.shutdown()
+            server.server_close()
+            batcher.close()
+
+        request.addfinalizer(stop)
+
+        def post(body):
+            http_request = urllib.request.Request(
+                f"http://127.0.0.1:{server.server_port}/predict",
+                data=dumps(body).encode(),
+            )
+            with urllib.request.urlopen(http_request, timeout=5) as response:
+                return loads(response.read())
+
+        return post
+
+    return start
+
+
+def test_http_handler_times_out(serve):
+    post = serve(MicroBatcher(FakePipeline(delay=1), max_batch_size=1), 0.05)
+    with pytest.raises(urllib.error.HTTPError) as http_error:
+        post({"text": "slow"})
+    assert http_error.value.code == 504
+
+
+@pytest.mark.parametrize(
+    "body",
+    [{"text": 5}, {"texts": "abc"}, {"texts": ["ok", None]}, ["text"]],
+    ids=["int text", "str texts", "none in texts", "not an object"],
+)
+def test_http_handler_rejects_bad_bodies(serve, body):
+    pipeline = FakePipeline()
+    post = serve(MicroBatcher(pipeline, max_latency_ms=50))
+    with pytest.raises(urllib.error.HTTPError) as http_error:
+        post(body)
+    assert http_error.value.code == 400
+    assert post({"texts": ["a", "ab"]}) == {"targets": [1, 0]}
+    assert pipeline.batches == [["a", "ab"]]
@@ -0,0 +1,86 @@
+import numpy
+import pytest
+
+from tree_models.random_forest import CustomRandomForest
+
+
+@pytest.fixture
+def batch(make_data):
+    return make_data(number_rows=100, number_features=3)
+
+
+def test_warm_start_adds_only_missing_trees(batch):
+    numpy.random.seed(0)
+    forest = CustomRandomForest(number_trees=3, warm_start=True)
+    forest.fit(*batch)
+    first_trees = list(forest.decision_trees)
+    forest.number_trees = 5
+    forest.fit(*batch)
+    assert len(forest.decision_trees) == 5
+    assert forest.decision_trees[:3] == first_trees
+
+
+def test_refit_trees_in_turn(batch):
+    numpy.random.seed(0)
+    forest = CustomRandomForest(number_trees=3)
+    forest.fit(*batch)
+    assert forest.refit_trees(*batch, number_refit=2) == [0, 1]
+    assert forest.refit_trees(*batch, number_refit=2) == [2, 0]
+
+
+@pytest.mark.parametrize(
+    "dataframe, targets",
+    [
+        (numpy.zeros((0, 3)), numpy.zeros(0, dtype=int)),
+        (numpy.zeros((4, 3)), numpy.array([0.0, 1.0, 0.5, 1.0])),
+        (numpy.zeros((4, 2)), numpy.array([0, 1, 0, 1])),
+    ],
+    ids=["empty", "float targets", "wrong width"],
+)
+def test_refit_trees_rejects_bad_batches(batch, dataframe, targets):
+    numpy.random.seed(0)
+    forest = CustomRandomForest(number_trees=2)
+    forest.fit(*batch)
+    with pytest.raises(ValueError):
+        forest.refit_trees(dataframe, targets)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"indexes": [2]}, {"indexes": [0, -1]}, {"number_refit": 0}],
+    ids=["index too high", "negative index", "no tree"],
+)
+def test_refit_trees_rejects_bad_selections_before_fitting(batch, monkeypatch, options):
+    numpy.random.seed(0)
+    forest = CustomRandomForest(number_trees=2)
+    forest.fit(*batch)
+    trees = list(forest.decision_trees)
+
+    def unexpected_build(dataframe, targets):
+        raise AssertionError("a tree was built")
+
+    monkeypatch.setattr(forest, "_build_decision_tree", unexpected_build)
+    with pytest.raises(ValueError):
+        forest.refit_trees(*batch, **options)
+    assert forest.decision_trees == trees
+    assert forest._refit_cursor == 0
+
+
+def test_fit_gives_up_after_maximum_fit_retries(batch, monkeypatch):
+    def failing_fit(self, dataframe, targets):
+        raise ArithmeticError("split failure")
+
+    monkeypatch.setattr("tree_models.random_forest.CustomDecisionTree.fit", failing_fit)
+    forest = CustomRandomForest(number_trees=1)
+    with pytest.raises(RuntimeError):
+        forest.fit(*batch)
+
+
+def test_invalid_max_leaf_nodes_raises():
+    with pytest.raises(ValueError):
+        CustomRandomForest(max_leaf_nodes=0)
+
+
+def test_invalid_criterion_raises():
+    with pytest.raises(ValueError):
+        CustomRandomForest(criterion="foo")
@@ -0,0 +1,229 @@
+from collections import Counter
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import List, Optional
+from numpy import (
+    array,
+    asarray,
+    float32,
+    float64,
+    int32,
+    ndarray,
+    swapaxes,
+    where,
+    zeros,
+)
+from tree_models.decision_tree import CustomDecisionTree, Node
+from tree_models.random_forest import CustomRandomForest
+
+
+@dataclass
+class CompactionReport:
+    """
+    Node counts of the trees before and after compaction
+    """
+
+    nodes_before: int = 0
+    nodes_after: int = 0
+    leaves_before: int = 0
+    leaves_after: int = 0
+
+    def __add__(self, other: "CompactionReport") -> "CompactionReport":
+        return CompactionReport(
+            self.nodes_before + other.nodes_before,
+            self.nodes_after + other.nodes_after,
+            self.leaves_before + other.leaves_before,
+            self.leaves_after + other.leaves_after,
+        )
+
+
+def count_nodes(node: Optional[Node]) -> tuple[int, int]:
+    """
+    Function to count the nodes and the leafs of a tree.
+
+    Input:
+        node, Optional[Node]: the root of the tree
+    Output:
+        tuple[int, int]: the number of nodes and the number of leafs
+    """
+    nodes, leaves = 0, 0
+    stack = [node] if node else []
+    while stack:
+        current = stack.pop()
+        nodes += 1
+        if current.is_leaf():
+            leaves += 1
+        else:
+            stack.extend((current.left, current.right))
+    return nodes, leaves
+
+
+def merge_redundant(node: Node) -> Node:
+    """
+    Function to collapse recursively the subtrees whose leafs all predict the same label. Predictions are unchanged.
+
+    Input:
+        node, Node: the root of the subtree
+    Output:
+        Node: the root of the merged subtree
+    """
+    if node.is_leaf():
+        return node
+    node.left, node.right = merge_redundant(node.left), merge_redundant(node.right)
+    if (
+        node.left.is_leaf()
+        and node.right.is_leaf()
+        and node.left.value == node.right.value
+    ):
+        return Node(value=node.left.value, samples=node.samples)
+    return node
+
+
+def prune(node: Node, minimum_gain: float = 0, minimum_samples: int = 0) -> Node:
+    """
+    Function to replace by a leaf of their most common label the splits with an information gain lower than minimum_gain or fitted on less than minimum_samples. Predictions may change.
+
+    Input:
+        node, Node: the root of the subtree
+        minimum_gain, float: the minimum information gain of a kept split
+        minimum_samples, int: the minimum number of training samples of a kept split
+    Output:
+        Node: the root of the pruned subtree
+    """
+    if node.is_leaf():
+        return node
+    if node.gain < minimum_gain or node.samples < minimum_samples:
+        return Node(value=node.label, samples=node.samples)
+    node.left = prune(node.left, minimum_gain, minimum_samples)
+    node.right = prune(node.right, minimum_gain, minimum_samples)
+    return node
+
+
+class CompactTree:
+    """
+    Flat array representation of a trained tree, node i splits on features[i] <= thresholds[i], leafs have lefts[i] == -1
+    Thresholds are stored in float32 only when they all are exactly representable in float32, so predictions stay identical
+    """
+
+    def __init__(self, root: Node) -> None:
+        features, thresholds, lefts, rights, values = [], [], [], [], []
+        stack = [(root, -1, False)]
+        while stack:
+            node, parent, is_right = stack.pop()
+            index = len(features)
+            if parent >= 0:
+                (rights if is_right else lefts)[parent] = index
+            features.append(0 if node.is_leaf() else node.feature)
+            thresholds.append(0 if node.is_leaf() else node.threshold)
+            lefts.append(-1)
+            rights.append(-1)
+            values.append(node.value if node.is_leaf() else 0)
+            if not node.is_leaf():
+                stack.append((node.right, index, True))
+                stack.append((node.left, index, False))
+        self.features = array(features, dtype=int32)
+        self.thresholds = array(thresholds, dtype=float64)
+        if (self.thresholds.astype(float32) == self.thresholds).all():
+            self.thresholds = self.thresholds.astype(float32)
+        self.lefts = array(lefts, dtype=int32)
+        self.rights = array(rights, dtype=int32)
+        self.values = array(values, dtype=float64)
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def predict(self, dataframe: ndarray) -> ndarray:
+        """
+        Function to predict target values from a dataframe, all the observations walk down the tree together.
+
+        Input:
+            dataframe, ndarray: The matrix of the values of the dataframe, compared in float64
+        Output:
+            ndarray: The matrix of the predicted target labels
+        """
+        dataframe = asarray(dataframe, dtype=float64)
+        nodes = zeros(len(dataframe), dtype=int32)
+        active = where(self.lefts[nodes] >= 0)[0]
+        while active.size:
+            current = nodes[active]
+            go_left = (
+                dataframe[active, self.features[current]] <= self.thresholds[current]
+            )
+            nodes[active] = where(go_left, self.lefts[current], self.rights[current])
+            active = active[self.lefts[nodes[active]] >= 0]
+        return self.values[nodes]
+
+
+class CompactForest:
+    """
+    Majority vote of compact trees
+    """
+
+    def __init__(self, trees: List[CompactTree]) -> None:
+        self.trees = trees
+
+    def predict(self, dataframe: ndarray) -> List[float]:
+        """
+        Function to predict targets corresponding to values, votes the same way as CustomRandomForest.predict
+
+        Input:
+            dataframe, ndarray : The matrix of the values to predict
+        Output:
+            List[float] : The list of predicted target values
+        """
+        targets = swapaxes(
+            array([tree.predict(dataframe) for tree in self.trees]), 0, 1
+        )
+        return [Counter(preds).most_common(1)[0][0] for preds in targets]
+
+
+def compact_tree(
+    tree: CustomDecisionTree,
+    minimum_gain: Optional[float] = None,
+    minimum_samples: Optional[int] = None,
+) -> tuple[CompactTree, CompactionReport]:
+    """
+    Function to compact a trained tree: optional pruning, redundant subtrees merging and float32 (when exact) / int32 storage.
+
+    Input:
+        tree, CustomDecisionTree: the trained tree, left unchanged
+        minimum_gain, Optional[float]: prune the splits with a lower information gain
+        minimum_samples, Optional[int]: prune the splits fitted on less samples
+    Output:
+        tuple[CompactTree, CompactionReport]: the compact tree and its node counts before and after
+    """
+    if not tree.root:
+        raise Exception("The model need to have been train before compaction")
+    nodes_before, leaves_before = count_nodes(tree.root)
+    root = deepcopy(tree.root)  # prune and merge_redundant rewrite the nodes
+    if minimum_gain is not None or minimum_samples is not None:
+        root = prune(root, minimum_gain or 0, minimum_samples or 0)
+    root = merge_redundant(root)
+    nodes_after, leaves_after = count_nodes(root)
+    report = CompactionReport(nodes_before, nodes_after, leaves_before, leaves_after)
+    return CompactTree(root), report
+
+
+def compact_forest(
+    forest: CustomRandomForest,
+    minimum_gain: Optional[float] = None,
+    minimum_samples: Optional[int] = None,
+) -> tuple[CompactForest, CompactionReport]:
+    """
+    Function to compact all the trees of a trained random forest, see compact_tree.
+
+    Input:
+        forest, CustomRandomForest: the trained random forest, left unchanged
+        minimum_gain, Optional[float]: prune the splits with a lower information gain
+        minimum_samples, Optional[int]: prune the splits fitted on less samples
+    Output:
+        tuple[CompactForest, CompactionReport]: the compact forest and its summed node counts
+    """
+    trees, report = [], CompactionReport()
+    for decision_tree in forest.decision_trees:
+        compact, tree_report = compact_tree(
+            decision_tree, minimum_gain, minimum_samples
+        )
+        trees.append(compact)
+        report += tree_report
+    return CompactForest(trees), report
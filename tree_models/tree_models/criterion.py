@@ -0,0 +1,104 @@
+from typing import Callable, Dict
+from numpy import (
+    append,
+    arange,
+    argsort,
+    errstate,
+    log2,
+    ndarray,
+    sum,
+    unique,
+    where,
+    zeros,
+)
+
+Criterion = Callable[[ndarray], ndarray]
+
+
+def _proportions(class_counts: ndarray) -> ndarray:
+    """
+    Function to turn class counts into class proportions, rows without samples stay at 0.
+
+    Input:
+        class_counts, ndarray: The matrix of class counts, one row per node, one column per class label
+    Output:
+        ndarray: The matrix of class proportions
+    """
+    totals = class_counts.sum(axis=-1, keepdims=True)
+    return class_counts / where(totals == 0, 1, totals)
+
+
+def entropy(class_counts: ndarray) -> ndarray:
+    """
+    Function to calculate the entropy of many nodes at once.
+
+    Input:
+        class_counts, ndarray: The matrix of class counts, one row per node, one column per class label
+    Output:
+        ndarray: the entropy of each row
+    Mathematics expression:
+        -Sum(i -> n)P(xi)*log2(P(xi))
+    """
+    proportions = _proportions(class_counts)
+    with errstate(divide="ignore", invalid="ignore"):
+        terms = where(proportions > 0, -proportions * log2(proportions), 0)
+    return sum(terms, axis=-1)
+
+
+def gini(class_counts: ndarray) -> ndarray:
+    """
+    Function to calculate the gini impurity of many nodes at once.
+
+    Input:
+        class_counts, ndarray: The matrix of class counts, one row per node, one column per class label
+    Output:
+        ndarray: the gini impurity of each row
+    Mathematics expression:
+        1 - Sum(i -> n)P(xi)**2
+    """
+    return 1 - sum(_proportions(class_counts) ** 2, axis=-1)
+
+
+CRITERIA: Dict[str, Criterion] = {"entropy": entropy, "gini": gini}
+
+
+def threshold_gains(
+    feature_values: ndarray,
+    target_values: ndarray,
+    criterion: Criterion,
+    number_class_labels: int,
+) -> tuple[ndarray, ndarray]:
+    """
+    Function to score every threshold of a feature at once. The thresholds are the unique values of the feature, samples lower or equal go left.
+
+    Input:
+        feature_values, ndarray: The matrix of the values of one feature
+        target_values, ndarray: The matrix of the target labels
+        criterion, Criterion: the impurity function, see CRITERIA
+        number_class_labels, int: the number of class labels, labels are 0 to number_class_labels - 1
+    Output:
+        tuple[ndarray, ndarray]: the ascending thresholds and their information gain, 0 when a side is empty
+    Mathematics expression:
+        I(parent) - ( I(left_child) * (length_left_child / length_parent) + I(right_child) * (length_right_child / length_parent) )
+    """
+    total_length = len(target_values)
+    order = argsort(feature_values, kind="stable")
+    sorted_values = feature_values[order]
+
+    one_hot = zeros((total_length, number_class_labels))
+    one_hot[arange(total_length), target_values[order]] = 1
+    cumulative_counts = one_hot.cumsum(axis=0)
+
+    thresholds, first_indexes = unique(sorted_values, return_index=True)
+    last_indexes = append(first_indexes[1:], total_length) - 1
+    left_counts = cumulative_counts[last_indexes]
+    parent_counts = cumulative_counts[-1]
+    right_counts = parent_counts - left_counts
+
+    left_lengths = last_indexes + 1
+    right_lengths = total_length - left_lengths
+    child_loss = (
+        left_lengths * criterion(left_counts) + right_lengths * criterion(right_counts)
+    ) / total_length
+    gains = criterion(parent_counts) - child_loss
+    return thresholds, where((left_lengths == 0) | (right_lengths == 0), 0, gains)
@@ -1,6 +1,18 @@
 from dataclasses import dataclass
+from heapq import heappop, heappush
+from itertools import count
 from typing import Optional
-from numpy import argmax, argwhere, array, bincount, log2, ndarray, random, unique, sum
+from numpy import (
+    arange,
+    argmax,
+    argwhere,
+    array,
+    bincount,
+    ndarray,
+    random,
+    unique,
+)
+from tree_models.criterion import CRITERIA, Criterion, threshold_gains
 
 
 class Node:
@@ -12,7 +24,10 @@ class Node:
         left=None,
         right=None,
         *,
-        value: Optional[float] = None
+        value: Optional[float] = None,
+        label: Optional[float] = None,
+        samples: int = 0,
+        gain: float = 0
     ) -> None:
         pass
         self.feature = feature
@@ -20,13 +35,49 @@ class Node:
         self.value = value
         self.left = left
         self.right = right
+        self.label = value if label is None else label
+        self.samples = samples
+        self.gain = gain
+
+    def is_leaf(self) -> bool:
+        """
+        Boolean function if the node is a leaf, the leafs are the only nodes with values
+        """
+        return self.value is not None
 
 
 class CustomDecisionTree:
 
-    def __init__(self, maximum_depth=100, minimum_samples_split=2) -> None:
+    def __init__(
+        self,
+        maximum_depth=100,
+        minimum_samples_split=2,
+        *,
+        best_first=False,
+        max_leaf_nodes: Optional[int] = None,
+        min_gain: Optional[float] = None,
+        criterion: str = "entropy",
+    ) -> None:
+        """
+        Input:
+            maximum_depth, int: the maximum depth of the tree
+            minimum_samples_split, int: the minimum number of samples to split a node
+            best_first, bool: grow the tree by expanding first the frontier node with the highest information gain, implied by max_leaf_nodes
+            max_leaf_nodes, Optional[int]: the maximum number of leafs, best-first only
+            min_gain, Optional[float]: the minimum information gain of a split
+            criterion, str: the impurity measure of the information gain, see CRITERIA
+        """
+        if criterion not in CRITERIA:
+            raise ValueError(f"criterion must be one of {list(CRITERIA)}")
+        if max_leaf_nodes is not None and max_leaf_nodes < 1:
+            raise ValueError("max_leaf_nodes must be at least 1")
         self.maximum_depth: int = maximum_depth
         self.minimum_sample_split: int = minimum_samples_split
+        self.best_first: bool = best_first or max_leaf_nodes is not None
+        self.max_leaf_nodes: Optional[int] = max_leaf_nodes
+        self.min_gain: Optional[float] = min_gain
+        self.criterion: str = criterion
+        self._criterion: Criterion = CRITERIA[criterion]
         self.root: Optional[Node] = None
         self.number_samples: int = 0
         self.number_features: int = 0
@@ -49,26 +100,6 @@ class CustomDecisionTree:
             or self.number_class_labels == 1
         )
 
-    def _entropy(self, target_values: ndarray) -> float:
-        """
-        Function to calculate the entropy, the average level of uncertainty. It is a great indicator of the node's potential and necessary to calculate information gain.
-
-        Input:
-            target_values, ndarray: The matrix of the target labels
-        Output:
-            float: the enthopy of the target values, between 0 and 1
-        Mathematics expression:
-            Sum(i -> n)P(xi)*logp(xi)
-        """
-        proportions = bincount(target_values) / len(target_values)
-        return -sum(
-            [
-                proportion * log2(proportion)
-                for proportion in proportions
-                if proportion > 0
-            ]
-        )
-
     def _create_split(self, dataframe: ndarray, threshold: float) -> tuple:
         """
         Function to divide in two splits the dataframe indexes by a specific threshold.
@@ -83,66 +114,37 @@ class CustomDecisionTree:
         right_indexes = argwhere(dataframe > threshold).flatten()
         return left_indexes, right_indexes
 
-    def _information_gain(
-        self, dataframe: ndarray, target_values: ndarray, threshold: float
-    ) -> float:
-        """
-        Function to calculate information gain, the substraction of the children enthropy to the parent (with correct proportion to keep a value between 0 and 1).
-
-        Input:
-            dataframe, ndarray: The matrix of the values of the dataframe
-            target_values, ndarray: The matrix of the target labels
-            threshold, float: the number chosen to split in two the dataframe
-        Output:
-            float: the information gain of the parent with the two children
-        Mathematics expression:
-            E(parent) - ( E(left_child) * (length_left_child / length_parent) + E(right_child) * (length_right_child / length_parent) )
-        """
-        parent_loss = self._entropy(target_values)
-        left_indexes, right_indexes = self._create_split(dataframe, threshold)
-        total_length, left_length, right_length = (
-            len(target_values),
-            len(left_indexes),
-            len(right_indexes),
-        )
-
-        if left_length == 0 or right_length == 0:
-            return 0
-
-        child_loss = left_length / total_length * self._entropy(
-            target_values[left_indexes]
-        ) + right_length / total_length * self._entropy(target_values[right_indexes])
-        return parent_loss - child_loss
-
     def _best_split(
         self, dataframe: ndarray, target_values: ndarray, features: ndarray
-    ) -> tuple[int, float]:
+    ) -> tuple[int, float, float]:
         """
-        Function to find the best split with specific feature and threshold.
+        Function to find the best split with specific feature and threshold, all the thresholds of a feature are scored at once with the criterion.
 
         Input:
             dataframe, ndarray: The matrix of the values of the dataframe
             target_values, ndarray: The matrix of the target labels
             features, float: the matrix of  indexes of features
         Output:
-            tuple[int, float]: The best feature index and the best threshold
+            tuple[int, float, float]: The best feature index, the best threshold and its information gain
         """
         split = {"score": -1, "feature": None, "threshold": None}
+        number_class_labels = int(target_values.max()) + 1
 
         for feature in features:
-            dataframe_by_feature = dataframe[:, feature]
-            thresholds = unique(dataframe_by_feature)
-            for threshold in thresholds:
-                score = self._information_gain(
-                    dataframe_by_feature, target_values, threshold
-                )
+            thresholds, scores = threshold_gains(
+                dataframe[:, feature],
+                target_values,
+                self._criterion,
+                number_class_labels,
+            )
+            best = argmax(scores)
 
-                if score > split["score"]:
-                    split["score"] = score
-                    split["feature"] = feature
-                    split["threshold"] = threshold
+            if scores[best] > split["score"]:
+                split["score"] = scores[best]
+                split["feature"] = feature
+                split["threshold"] = thresholds[best]
 
-        return split["feature"], split["threshold"]
+        return split["feature"], split["threshold"], split["score"]
 
     def _most_common_label(self, target_values: ndarray) -> float:
         """
@@ -171,25 +173,117 @@ class CustomDecisionTree:
         self.number_samples, self.number_features = dataframe.shape
         self.number_class_labels = len(unique(target_values))
 
+        label = self._most_common_label(target_values)
         if self._is_finished(depth):
-            return Node(value=self._most_common_label(target_values))
+            return Node(value=label, samples=self.number_samples)
 
         random_features = random.choice(
             self.number_features, self.number_features, replace=False
         )
-        best_feature, best_threshold = self._best_split(
+        number_samples = self.number_samples
+        best_feature, best_threshold, best_gain = self._best_split(
             dataframe, target_values, random_features
         )
+        if self.min_gain is not None and best_gain < self.min_gain:
+            return Node(value=label, samples=number_samples)
 
         left_indexes, right_indexes = self._create_split(
             dataframe[:, best_feature], best_threshold
         )
+        if len(left_indexes) == 0 or len(right_indexes) == 0:
+            return Node(value=label, samples=number_samples)
         left_child, right_child = self._build_tree(
             dataframe[left_indexes, :], target_values[left_indexes], depth+1
         ), self._build_tree(
             dataframe[right_indexes, :], target_values[right_indexes], depth+1
         )
-        return Node(best_feature, best_threshold, left_child, right_child)
+        return Node(
+            best_feature,
+            best_threshold,
+            left_child,
+            right_child,
+            label=label,
+            samples=number_samples,
+            gain=best_gain,
+        )
+
+    def _evaluate_split(
+        self, dataframe: ndarray, target_values: ndarray, depth: float
+    ) -> Optional[tuple[int, float, float]]:
+        """
+        Function to find the best split of a frontier node for the best-first growth.
+
+        Input:
+            dataframe, ndarray: The matrix of the values of the node samples
+            target_values, ndarray: The matrix of the target labels of the node samples
+            depth, float: the depth of the node into the tree
+        Output:
+            Optional[tuple[int, float, float]]: The best feature index, threshold and information gain, None if the node stays a leaf
+        """
+        self.number_samples, self.number_features = dataframe.shape
+        self.number_class_labels = len(unique(target_values))
+        if self._is_finished(depth):
+            return None
+
+        random_features = random.choice(
+            self.number_features, self.number_features, replace=False
+        )
+        best_feature, best_threshold, best_gain = self._best_split(
+            dataframe, target_values, random_features
+        )
+        left_indexes, right_indexes = self._create_split(
+            dataframe[:, best_feature], best_threshold
+        )
+        if len(left_indexes) == 0 or len(right_indexes) == 0:
+            return None
+        if self.min_gain is not None and best_gain < self.min_gain:
+            return None
+        return best_feature, best_threshold, best_gain
+
+    def _build_tree_best_first(
+        self, dataframe: ndarray, target_values: ndarray
+    ) -> Node:
+        """
+        Function to build the decision tree by always splitting the frontier leaf with the highest information gain, until max_leaf_nodes leafs or no split left.
+
+        Input:
+            dataframe, ndarray: The matrix of the values of the dataframe
+            target_values, ndarray: The matrix of the target labels
+        Output:
+            Node: the root of the tree
+        """
+        frontier: list = []
+        order = count()  # Ties are expanded in insertion order
+
+        def push(indexes: ndarray, depth: float) -> Node:
+            node = Node(
+                value=self._most_common_label(target_values[indexes]),
+                samples=len(indexes),
+            )
+            split = self._evaluate_split(
+                dataframe[indexes, :], target_values[indexes], depth
+            )
+            if split is not None:
+                heappush(
+                    frontier, (-split[2], next(order), node, indexes, depth, split)
+                )
+            return node
+
+        root = push(arange(len(target_values)), 0)
+        number_leafs = 1
+        while frontier and (
+            self.max_leaf_nodes is None or number_leafs < self.max_leaf_nodes
+        ):
+            _, _, node, indexes, depth, split = heappop(frontier)
+            node.feature, node.threshold, node.gain = split
+            left_indexes, right_indexes = self._create_split(
+                dataframe[indexes, node.feature], node.threshold
+            )
+            node.left = push(indexes[left_indexes], depth + 1)
+            node.right = push(indexes[right_indexes], depth + 1)
+            node.value = None
+            number_leafs += 1
+        return root
 
     def _traverse_tree(self, serie: ndarray, node: Optional[Node]) -> float:
         """
@@ -203,7 +297,7 @@ class CustomDecisionTree:
         """
         if not node:
             raise Exception("The model need to have been train before predictions")
-        if node.value:  # The nodes with values are the leafs of the tree
+        if node.is_leaf():
             return node.value
 
         if serie[node.feature] <= node.threshold:
@@ -220,9 +314,12 @@ class CustomDecisionTree:
         Output:
             None
         Self output:
-            self.root, Node : self._build_tree method
+            self.root, Node : self._build_tree or self._build_tree_best_first method
         """
-        self.root = self._build_tree(dataframe, target_values)
+        if self.best_first:
+            self.root = self._build_tree_best_first(dataframe, target_values)
+        else:
+            self.root = self._build_tree(dataframe, target_values)
 
     def predict(self, dataframe: ndarray) -> ndarray:
         """
@@ -235,4 +332,4 @@ class CustomDecisionTree:
         Output:
             ndarray: The matrix of the predicted target labels
         """
-        return array(self._traverse_tree(serie, self.root) for serie in dataframe)
+        return array([self._traverse_tree(serie, self.root) for serie in dataframe])
@@ -1,17 +1,42 @@
 from collections import Counter
-from typing import List, Tuple
-from numpy import random, swapaxes
+from typing import List, Optional, Tuple
+from numpy import bool_, integer, issubdtype, random, swapaxes
 from numpy._typing import NDArray
+from tree_models.criterion import CRITERIA
 from tree_models.decision_tree import CustomDecisionTree
 
 class CustomRandomForest:
     '''
     '''
-    def __init__(self, number_trees=25, minimum_samples_split=2, maximum_depth=5):
+    maximum_fit_retries = 10
+
+    def __init__(
+        self,
+        number_trees=25,
+        minimum_samples_split=2,
+        maximum_depth=5,
+        warm_start=False,
+        *,
+        best_first=False,
+        max_leaf_nodes: Optional[int] = None,
+        min_gain: Optional[float] = None,
+        criterion: str = "entropy",
+    ):
+        if max_leaf_nodes is not None and max_leaf_nodes < 1:
+            raise ValueError("max_leaf_nodes must be at least 1")
+        if criterion not in CRITERIA:
+            raise ValueError(f"criterion must be one of {list(CRITERIA)}")
         self.number_trees = number_trees
         self.minimum_samples_split = minimum_samples_split
         self.maximum_depth = maximum_depth
+        self.best_first = best_first
+        self.max_leaf_nodes = max_leaf_nodes
+        self.min_gain = min_gain
+        self.criterion = criterion
+        self.warm_start = warm_start
         self.decision_trees = []
+        self.number_features = 0
+        self._refit_cursor = 0
         
     @staticmethod
     def _sample(dataframe: NDArray, targets: NDArray) -> Tuple[NDArray, NDArray]:
@@ -28,31 +53,137 @@ class CustomRandomForest:
         samples = random.choice(a=number_rows, size=number_rows, replace=True)
         return dataframe[samples], targets[samples]
         
+    @staticmethod
+    def _check_batch(dataframe: NDArray, targets: NDArray) -> None:
+        '''
+        Function to check a training batch before fitting trees on it
+
+        Input:
+            dataframe, NDArray : The matrix of the values to predict
+            targets, NDArray : The matrix of target values
+        Conditions:
+            non empty 2D dataframe, one non negative integer label per row
+        '''
+        if dataframe.ndim != 2 or len(dataframe) == 0:
+            raise ValueError("dataframe must be a non empty 2D matrix")
+        if len(targets) != len(dataframe):
+            raise ValueError(
+                f"{len(targets)} targets for {len(dataframe)} dataframe rows"
+            )
+        if not (issubdtype(targets.dtype, integer) or targets.dtype == bool_):
+            raise ValueError(f"targets must be integer labels, got {targets.dtype}")
+        if targets.min() < 0:
+            raise ValueError("targets must be non negative labels")
+
+    def _build_decision_tree(
+        self, dataframe: NDArray, targets: NDArray
+    ) -> CustomDecisionTree:
+        '''
+        Function to fit a decision tree on a random sample,
+        resampling up to maximum_fit_retries times when the fit fails
+
+        Input:
+            dataframe, NDArray : The matrix of the values to predict
+            targets, NDArray : The matrix of target values
+        Output:
+            CustomDecisionTree : The fitted decision tree
+        '''
+        last_error = None
+        for _ in range(self.maximum_fit_retries):
+            decision_tree = CustomDecisionTree(
+                minimum_samples_split=self.minimum_samples_split,
+                maximum_depth=self.maximum_depth,
+                best_first=self.best_first,
+                max_leaf_nodes=self.max_leaf_nodes,
+                min_gain=self.min_gain,
+                criterion=self.criterion,
+            )
+            _sampled_dataframe, _sampled_targets = self._sample(dataframe, targets)
+            try:
+                decision_tree.fit(_sampled_dataframe, _sampled_targets)
+                return decision_tree
+            except Exception as e:
+                last_error = e
+        raise RuntimeError(
+            f"Failed to fit a decision tree in {self.maximum_fit_retries} samples"
+        ) from last_error
+
     def fit(self, dataframe: NDArray, targets: NDArray) -> None:
         '''
-        Function to build and fit the random forest to a datafrale and its target values 
-        
-        Input:        
+        Function to build and fit the random forest to a datafrale and its target values
+        With warm_start, the already fitted trees are kept and only the missing trees
+        up to number_trees are built
+
+        Input:
             dataframe, NDarray : The matrix of the values to predict
             targets, NDArray : The matrix of target values
         '''
-        if len(self.decision_trees) > 0:
+        self._check_batch(dataframe, targets)
+        if not self.warm_start:
             self.decision_trees = []
-            
-        number_built = 0
-        while number_built < self.number_trees:
-            try:
-                decision_tree = CustomDecisionTree(
-                    minimum_samples_split=self.minimum_samples_split,
-                    maximum_depth=self.maximum_depth
+        elif self.number_trees < len(self.decision_trees):
+            raise ValueError(
+                f"number_trees={self.number_trees} must be at least the "
+                f"{len(self.decision_trees)} fitted trees with warm_start"
+            )
+        elif self.decision_trees and dataframe.shape[1] != self.number_features:
+            raise ValueError(
+                f"dataframe has {dataframe.shape[1]} features, "
+                f"the forest was fitted on {self.number_features}"
+            )
+
+        self.number_features = dataframe.shape[1]
+        while len(self.decision_trees) < self.number_trees:
+            self.decision_trees.append(self._build_decision_tree(dataframe, targets))
+
+    def refit_trees(
+        self,
+        dataframe: NDArray,
+        targets: NDArray,
+        number_refit: int = 1,
+        indexes: Optional[List[int]] = None,
+    ) -> List[int]:
+        '''
+        Function to refresh a subset of the fitted trees on a new batch,
+        the other trees are kept. Without indexes, the trees are picked in turn
+        so successive batches refresh the whole forest
+
+        Input:
+            dataframe, NDArray : The matrix of the values of the new batch
+            targets, NDArray : The matrix of target values of the new batch
+            number_refit, int : The number of trees to refit, when indexes is not given
+            indexes, Optional[List[int]] : The indexes of the trees to refit
+        Output:
+            List[int] : The indexes of the refitted trees
+        '''
+        if not self.decision_trees:
+            raise Exception("The model need to have been train before refitting trees")
+        self._check_batch(dataframe, targets)
+        if dataframe.shape[1] != self.number_features:
+            raise ValueError(
+                f"dataframe has {dataframe.shape[1]} features, "
+                f"the forest was fitted on {self.number_features}"
+            )
+        number_fitted = len(self.decision_trees)
+        if indexes is not None:
+            invalid = [index for index in indexes if not 0 <= index < number_fitted]
+            if invalid:
+                raise ValueError(
+                    f"indexes {invalid} out of range for {number_fitted} fitted trees"
                 )
-                _sampled_dataframe, _sampled_targets = self._sample(dataframe, targets)
-                decision_tree.fit(_sampled_dataframe, _sampled_targets)
-                self.decision_trees.append(decision_tree)
-                number_built += 1
-            except Exception as e:
-                continue
-    
+        elif number_refit < 1:
+            raise ValueError("number_refit must be at least 1")
+        else:
+            number_refit = min(number_refit, number_fitted)
+            indexes = [
+                (self._refit_cursor + i) % number_fitted for i in range(number_refit)
+            ]
+            self._refit_cursor = (self._refit_cursor + number_refit) % number_fitted
+
+        for index in indexes:
+            self.decision_trees[index] = self._build_decision_tree(dataframe, targets)
+        return indexes
+
     def predict(self, dataframe: NDArray) -> List[int]:
         '''
         Function to predict targets corresponding to values